@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -126,25 +126,29 @@ def login_user(
     summary="Request password reset",
     description="Send password reset email to user's registered email address"
 )
-async def request_password_reset(
+def request_password_reset(
         email_data: ForgottenPassword,
+        background_tasks: BackgroundTasks,
         database_session: Session = Depends(get_database)
 ) -> dict:
     """
     Send password reset email to user.
 
     Generates a unique reset token and sends it to the user's email address.
-    The token is stored in the database for later validation.
+    The token is stored in the database for later validation. The email is
+    sent in a background task once the response has been returned, so the
+    SMTP handshake is not on the request's critical path.
 
     Args:
         email_data: Email address of the user requesting reset
+        background_tasks: FastAPI background tasks used to send the email
         database_session: Database session dependency
 
     Returns:
-        dict: Confirmation message that email was sent
+        dict: Confirmation message that the email was queued
 
     Raises:
-        HTTPException: 401 if user not found, 500 if email sending fails
+        HTTPException: 401 if user not found
     """
     # Find user by email
     user = database_session.query(User).filter(User.email == email_data.email).first()
@@ -162,15 +166,9 @@ async def request_password_reset(
     user.password_token = reset_token
     database_session.commit()
 
-    # Send email
-    try:
-        await send_forgotten_password_email(user.email, user.username, reset_token)
-        return {"message": "Password reset email sent"}
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to send email"
-        )
+    # Send email after the response
+    background_tasks.add_task(send_forgotten_password_email, user.email, user.username, reset_token)
+    return {"message": "Password reset email sent"}
 
 
 @router.post(
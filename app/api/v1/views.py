@@ -1,11 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, raiseload
 from uuid import UUID
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
 from app.api.dependencies import get_database, get_current_user
 from app.models import User, View
 from app.schemas import ViewCreate, ViewResponse
+from app.utils.responses import json_list_response
+
+VIEW_LIST_ADAPTER = TypeAdapter(List[ViewResponse])
+
+# Largest bulk import accepted in one request, one insertmanyvalues page
+VIEWS_BULK_MAX_SIZE = 1000
 
 router = APIRouter(
     prefix="/views",
@@ -26,7 +34,7 @@ router = APIRouter(
 def get_user_views(
         user_id: UUID,
         database_session: Session = Depends(get_database)
-) -> List[ViewResponse]:
+) -> Response:
     """
     Get all viewing history for a user.
 
@@ -40,8 +48,8 @@ def get_user_views(
     Returns:
         List[ViewResponse]: Complete list of user's viewing history
     """
-    views = database_session.query(View).filter(View.viewer_id == user_id).all()
-    return [ViewResponse.model_validate(view) for view in views]
+    views = database_session.query(View).options(raiseload("*")).filter(View.viewer_id == user_id).all()
+    return json_list_response(VIEW_LIST_ADAPTER, views)
 
 
 @router.get(
@@ -55,7 +63,7 @@ def get_user_views_by_type(
         user_id: UUID,
         genre: Optional[int] = Query(None, description="Filter by specific genre ID"),
         database_session: Session = Depends(get_database)
-) -> List[ViewResponse]:
+) -> Response:
     """
     Get user viewing history filtered by media type and genre.
 
@@ -71,17 +79,17 @@ def get_user_views_by_type(
     Returns:
         List[ViewResponse]: Filtered list of user's viewing history
     """
-    query = database_session.query(View).filter(
+    query = database_session.query(View).options(raiseload("*")).filter(
         View.viewer_id == user_id,
         View.media_type == media_type
     )
 
-    # Apply genre filter if specified
+    # Apply genre filter if specified (containment so the GIN index is used)
     if genre is not None:
-        query = query.filter(View.genre_ids.any(genre))
+        query = query.filter(View.genre_ids.op("@>")([genre]))
 
     views = query.all()
-    return [ViewResponse.model_validate(view) for view in views]
+    return json_list_response(VIEW_LIST_ADAPTER, views)
 
 
 @router.post(
@@ -138,6 +146,53 @@ def add_view(
     return {"message": "View added successfully"}
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Mark multiple media as watched",
+    description="Add several viewing records at once, e.g. when importing a viewing history"
+)
+def add_views_bulk(
+        views_data: Annotated[List[ViewCreate], Body(max_length=VIEWS_BULK_MAX_SIZE)],
+        current_user: User = Depends(get_current_user),
+        database_session: Session = Depends(get_database)
+) -> dict:
+    """
+    Add several viewing records in a single statement.
+
+    Inserts all records with one multi-row INSERT instead of one INSERT per
+    record, which keeps large viewing history imports to a single round trip.
+    Users can only add viewing records for themselves.
+
+    Args:
+        views_data: Viewing records including media information and viewer ID,
+            at most VIEWS_BULK_MAX_SIZE per request
+        current_user: Currently authenticated user
+        database_session: Database session dependency
+
+    Returns:
+        dict: Success message with the number of viewing records added
+
+    Raises:
+        HTTPException: 403 if any record targets another user
+    """
+    # Verify user is adding views for themselves only
+    if any(str(view_data.viewer_id) != str(current_user.id) for view_data in views_data):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to add view for this user"
+        )
+
+    if views_data:
+        database_session.execute(
+            insert(View),
+            [view_data.model_dump() for view_data in views_data]
+        )
+        database_session.commit()
+
+    return {"message": "Views added successfully", "count": len(views_data)}
+
+
 @router.delete(
     "/{view_id}",
     status_code=status.HTTP_204_NO_CONTENT,
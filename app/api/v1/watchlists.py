@@ -1,12 +1,47 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import Text, cast, func, literal_column, select
+from sqlalchemy.orm import Session, load_only, raiseload, selectinload
 from uuid import UUID
 from typing import List, Optional
 
 from app.api.dependencies import get_database, get_current_user
+from app.core.settings import settings
 from app.models import User, Watchlist, Media
-from app.schemas import WatchlistCreate, WatchlistUpdate, WatchlistResponse, WatchlistDetail, MediaResponse
+from app.schemas import WatchlistCreate, WatchlistUpdate, WatchlistResponse, WatchlistDetail
+from app.utils.cache import LRUCache
+from app.utils.responses import json_list_response
+
+WATCHLIST_LIST_ADAPTER = TypeAdapter(List[WatchlistResponse])
+
+# Unicode White_Space characters, the set pydantic's str_strip_whitespace trims
+# (str.strip() also trims \x1c-\x1f, pydantic does not)
+WHITESPACE_CHARACTERS = (
+    "\t\n\v\f\r \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+
+# One JSON object per media row, shaped like MediaResponse
+MEDIA_JSON_OBJECT = func.json_build_object(
+    "id", Media.id,
+    "tmdb_id", Media.tmdb_id,
+    "genre_ids", Media.genre_ids,
+    "poster_path", func.btrim(Media.poster_path, WHITESPACE_CHARACTERS),
+    "backdrop_path", func.btrim(Media.backdrop_path, WHITESPACE_CHARACTERS),
+    "release_date", func.btrim(Media.release_date, WHITESPACE_CHARACTERS),
+    "runtime", Media.runtime,
+    "title", func.btrim(Media.title, WHITESPACE_CHARACTERS),
+    "media_type", func.btrim(Media.media_type, WHITESPACE_CHARACTERS),
+    "watchlist_id", Media.watchlist_id
+)
+
+# Serialized media arrays of watchlist details, keyed by (watchlist_id, genre, medias_version)
+WATCHLIST_MEDIAS_CACHE = LRUCache(
+    maxsize=settings.WATCHLIST_CACHE_SIZE,
+    ttl=settings.WATCHLIST_CACHE_TTL
+)
 
 router = APIRouter(
     prefix="/watchlists",
@@ -27,7 +62,7 @@ router = APIRouter(
 def get_user_watchlists(
         user_id: UUID,
         database_session: Session = Depends(get_database)
-) -> List[WatchlistResponse]:
+) -> Response:
     """
     Get all watchlists for a specific user.
 
@@ -41,36 +76,18 @@ def get_user_watchlists(
     Returns:
         List[WatchlistResponse]: List of user's watchlists with media counts
     """
-    watchlists = database_session.query(
-        Watchlist.id,
-        Watchlist.title,
-        Watchlist.author_id,
-        func.count(Media.id).label('medias_count')
-    ).outerjoin(
-        Media, Watchlist.id == Media.watchlist_id
+    # Two queries whatever the number of watchlists: the watchlists, then
+    # one IN (...) query for all of their medias
+    watchlists = database_session.query(Watchlist).options(
+        selectinload(Watchlist.medias).options(
+            load_only(Media.id, Media.tmdb_id, Media.watchlist_id)
+        ),
+        raiseload("*")
     ).filter(
         Watchlist.author_id == user_id
-    ).group_by(
-        Watchlist.id, Watchlist.title, Watchlist.author_id
     ).all()
 
-    result = []
-    for watchlist_data in watchlists:
-        # Get media items for each watchlist
-        medias = database_session.query(Media.id, Media.tmdb_id).filter(
-            Media.watchlist_id == watchlist_data.id
-        ).all()
-
-        watchlist_response = WatchlistResponse(
-            id=watchlist_data.id,
-            title=watchlist_data.title,
-            author_id=watchlist_data.author_id,
-            medias=[{"id": media.id, "tmdb_id": media.tmdb_id} for media in medias],
-            medias_count=watchlist_data.medias_count or 0
-        )
-        result.append(watchlist_response)
-
-    return result
+    return json_list_response(WATCHLIST_LIST_ADAPTER, watchlists)
 
 
 @router.get(
@@ -83,7 +100,7 @@ def get_watchlist_details(
         watchlist_id: UUID,
         genre: Optional[int] = Query(None, description="Filter media by genre ID"),
         database_session: Session = Depends(get_database)
-) -> WatchlistDetail:
+) -> Response:
     """
     Get detailed watchlist information with all media items.
 
@@ -96,12 +113,14 @@ def get_watchlist_details(
         database_session: Database session dependency
 
     Returns:
-        WatchlistDetail: Complete watchlist information with media items
+        Response: WatchlistDetail JSON with the media array built by PostgreSQL
 
     Raises:
         HTTPException: 404 if watchlist doesn't exist
     """
-    watchlist = database_session.query(Watchlist).filter(Watchlist.id == watchlist_id).first()
+    watchlist = database_session.query(Watchlist).options(raiseload("*")).filter(
+        Watchlist.id == watchlist_id
+    ).first()
 
     if not watchlist:
         raise HTTPException(
@@ -109,25 +128,37 @@ def get_watchlist_details(
             detail="Watchlist not found"
         )
 
-    # Build media query
-    media_query = database_session.query(Media).filter(Media.watchlist_id == watchlist_id)
-
-    # Apply genre filter if specified
-    if genre is not None:
-        media_query = media_query.filter(Media.genre_ids.any(genre))
-
-    medias = media_query.all()
-
-    # Count total media items (without genre filter)
-    total_medias_count = database_session.query(func.count(Media.id)).filter(
-        Media.watchlist_id == watchlist_id
-    ).scalar()
-
-    return WatchlistDetail(
-        title=watchlist.title,
-        medias=[MediaResponse.model_validate(media) for media in medias],
-        medias_count=total_medias_count
-    )
+    # The media list only changes when medias_version is bumped, so a cached
+    # copy for the current version can be served without querying media_model
+    cache_key = (watchlist.id, genre, watchlist.medias_version)
+    medias_json = WATCHLIST_MEDIAS_CACHE.get(cache_key)
+
+    if medias_json is None:
+        # PostgreSQL aggregates the media rows into a JSON array so no Media
+        # objects are instantiated; cast to text to skip driver-side decoding
+        media_query = select(
+            cast(
+                func.coalesce(func.json_agg(MEDIA_JSON_OBJECT), literal_column("'[]'::json")),
+                Text
+            )
+        ).where(Media.watchlist_id == watchlist_id)
+
+        # Apply genre filter if specified
+        if genre is not None:
+            media_query = media_query.where(Media.genre_ids.any(genre))
+
+        medias_json = database_session.execute(media_query).scalar_one()
+        WATCHLIST_MEDIAS_CACHE.set(cache_key, medias_json)
+
+    # The cached array is embedded as-is; the title is stripped like the
+    # str_strip_whitespace WatchlistDetail applies. Total media items (without
+    # genre filter) comes from the denormalized count
+    content = orjson.dumps({
+        "title": watchlist.title.strip(WHITESPACE_CHARACTERS),
+        "medias": orjson.Fragment(medias_json),
+        "medias_count": watchlist.medias_count
+    })
+    return Response(content=content, media_type="application/json")
 
 
 @router.post(
@@ -18,6 +18,8 @@ config = ConnectionConfig(
     VALIDATE_CERTS=True
 )
 
+mail_client = FastMail(config)
+
 
 async def send_email(
         subject: str,
@@ -31,8 +33,6 @@ async def send_email(
     if not email_to:
         raise ValueError("The email_to list cannot be empty.")
 
-    mail_client = FastMail(config)
-
     message_args = {
         "subject": subject,
         "recipients": email_to,
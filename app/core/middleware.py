@@ -3,6 +3,7 @@ Middleware
 """
 # Libraries
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi import FastAPI
 
 # Modules
@@ -28,3 +29,14 @@ def setup_cors(app: FastAPI) -> None:
         ],
         expose_headers=["Set-Cookie"],
     )
+
+
+def setup_gzip(app: FastAPI) -> None:
+    """
+    Set up GZip compression for responses larger than 1 KiB.
+    """
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=1024,
+        compresslevel=5,
+    )
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Any, Union, Optional
+import hashlib
+import hmac
 import jwt
 import bcrypt
 import uuid
@@ -8,6 +10,8 @@ from app.core.exceptions.custom_exception import CustomExceptionError
 from app.core.settings import settings
 from app.services.constant.response_constant import EXPIRED_TOKEN_ERROR, INVALID_TOKEN_ERROR
 
+FAST_HASH_PREFIX = "sha256$"
+
 
 def create_access_token(
         subject: Union[str, Any], expires_delta: Optional[timedelta] = None
@@ -96,7 +100,14 @@ def hash_password(password: str) -> str:
     Example:
         >>> hashed = hash_password("mySecurePassword123!")
         >>> # Returns: "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj/RVSg2/CPK"
+
+    Note:
+        When FAST_PASSWORD_HASH_FOR_TESTS is enabled, a plain SHA-256 digest
+        is returned instead so test suites skip the bcrypt cost.
     """
+    if settings.FAST_PASSWORD_HASH_FOR_TESTS:
+        return FAST_HASH_PREFIX + hashlib.sha256(password.encode('utf-8')).hexdigest()
+
     salt = bcrypt.gensalt()
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
@@ -120,6 +131,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         >>> is_valid = verify_password("myPassword123", stored_hash)
         >>> # Returns: True or False
     """
+    if settings.FAST_PASSWORD_HASH_FOR_TESTS and hashed_password.startswith(FAST_HASH_PREFIX):
+        return hmac.compare_digest(
+            FAST_HASH_PREFIX + hashlib.sha256(plain_password.encode('utf-8')).hexdigest(),
+            hashed_password
+        )
+
     return bcrypt.checkpw(
         plain_password.encode('utf-8'),
         hashed_password.encode('utf-8')
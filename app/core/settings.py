@@ -6,6 +6,7 @@ using Pydantic Settings. It provides type-safe configuration management with
 validation and default values.
 """
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -23,7 +24,10 @@ class Settings(BaseSettings):
     # Application settings
     APP_NAME: str = "Scenario API"
     APP_VERSION: str = "2.0.0"
+    APP_PORT: int = 8000
     DEBUG: bool = True
+    # Uvicorn worker processes in production (same variable uvicorn reads)
+    WEB_CONCURRENCY: int = Field(2, ge=1)
 
     # CORS settings for frontend integration
     FRONTEND_URL: str
@@ -36,6 +40,10 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_HOST: str
 
+    # Connection budget shared by all API worker processes; keep it below the
+    # server's max_connections (100 by default on postgres:16-alpine)
+    DB_MAX_CONNECTIONS: int = 60
+
     # Database restore
     DB_CONTAINER_NAME: str
 
@@ -52,12 +60,19 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str
     SMTP_USE_TLS: bool = True
 
+    # In-process cache for watchlist detail reads
+    WATCHLIST_CACHE_SIZE: int = 1024
+    WATCHLIST_CACHE_TTL: int = 300
+
     # Security and validation settings
     PASSWORD_MIN_LENGTH: int = 7
     PASSWORD_MAX_LENGTH: int = 30
     USERNAME_MIN_LENGTH: int = 5
     USERNAME_MAX_LENGTH: int = 30
 
+    # Test suites only: replaces bcrypt with an unsalted SHA-256 digest
+    FAST_PASSWORD_HASH_FOR_TESTS: bool = False
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -0,0 +1,98 @@
+"""
+Database maintenance helpers shared by the restore scripts.
+"""
+
+import functools
+import logging
+import subprocess
+from collections import deque
+from typing import List, Optional
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Number of trailing stderr lines logged at ERROR when a command fails
+STDERR_TAIL_LINES = 50
+
+# One grouped aggregate over media_model for every watchlist at once;
+# watchlists without media fall back to 0 through the LEFT JOIN
+REFRESH_MEDIAS_COUNTS_SQL = text("""
+    UPDATE watchlist_model AS watchlist
+    SET medias_count = COALESCE(counts.medias_count, 0),
+        medias_version = watchlist.medias_version + 1
+    FROM watchlist_model AS target
+    LEFT JOIN (
+        SELECT watchlist_id, COUNT(*) AS medias_count
+        FROM media_model
+        GROUP BY watchlist_id
+    ) AS counts ON counts.watchlist_id = target.id
+    WHERE watchlist.id = target.id
+""")
+
+
+@functools.lru_cache(maxsize=1)
+def get_local_tables() -> List[str]:
+    """
+    Return list of tables in local DB (public schema).
+
+    Connection errors are raised rather than cached, so a retry once the
+    database is reachable sees the real table list.
+    """
+    engine = create_engine(settings.DATABASE_URL)
+    try:
+        return sorted(inspect(engine).get_table_names(schema="public"))
+    finally:
+        engine.dispose()
+
+
+def refresh_watchlist_medias_counts() -> bool:
+    """
+    Recompute watchlist_model.medias_count from media_model.
+
+    Dumps run with session_replication_role = replica, which disables the
+    trigger that normally maintains the count, so this must run after any
+    restore. medias_version is bumped too, invalidating cached media lists.
+    """
+    try:
+        engine = create_engine(settings.DATABASE_URL)
+        try:
+            with engine.begin() as connection:
+                result = connection.execute(REFRESH_MEDIAS_COUNTS_SQL)
+                logger.info(f"Refreshed media counts of {result.rowcount} watchlists")
+        finally:
+            engine.dispose()
+    except Exception as e:
+        logger.error(f"Could not refresh watchlist media counts: {e}")
+        return False
+    return True
+
+
+def run_streaming(command: List[str], env: Optional[dict] = None) -> int:
+    """
+    Run a command, logging its stderr line by line and discarding stdout.
+
+    Lines are streamed at INFO so large restores never buffer their output;
+    on a non-zero exit the last STDERR_TAIL_LINES lines are logged again at
+    ERROR so the failure is visible even without any logging configuration.
+    """
+    stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+    with subprocess.Popen(
+        command,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    ) as process:
+        for line in process.stderr:
+            line = line.rstrip()
+            stderr_tail.append(line)
+            logger.info(line)
+        returncode = process.wait()
+
+    if returncode != 0:
+        logger.error(f"Command failed with exit code {returncode}:\n" + "\n".join(stderr_tail))
+    return returncode
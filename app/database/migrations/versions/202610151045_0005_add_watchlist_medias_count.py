@@ -0,0 +1,62 @@
+"""0005_add_watchlist_medias_count
+
+Revision ID: e4b27c90d8f5
+Revises: 3d9b6e0f5a12
+Create Date: 2026-10-15 10:45:27.630914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b27c90d8f5'
+down_revision: Union[str, Sequence[str], None] = '3d9b6e0f5a12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('watchlist_model', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('medias_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill existing watchlists
+    op.execute("""
+        UPDATE watchlist_model w
+        SET medias_count = (SELECT count(*) FROM media_model m WHERE m.watchlist_id = w.id)
+    """)
+
+    # Keep the count in sync on insert, delete and when a media moves watchlist
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_watchlist_medias_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND NEW.watchlist_id IS NOT DISTINCT FROM OLD.watchlist_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE watchlist_model SET medias_count = medias_count + 1 WHERE id = NEW.watchlist_id;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE watchlist_model SET medias_count = medias_count - 1 WHERE id = OLD.watchlist_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER media_model_medias_count
+        AFTER INSERT OR DELETE OR UPDATE OF watchlist_id ON media_model
+        FOR EACH ROW EXECUTE FUNCTION sync_watchlist_medias_count()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS media_model_medias_count ON media_model")
+    op.execute("DROP FUNCTION IF EXISTS sync_watchlist_medias_count()")
+
+    with op.batch_alter_table('watchlist_model', schema=None) as batch_op:
+        batch_op.drop_column('medias_count')
@@ -0,0 +1,69 @@
+"""0007_add_watchlist_medias_version
+
+Revision ID: b6c3e18f0a49
+Revises: 7f1a9d24c6b8
+Create Date: 2026-10-15 11:15:36.502271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6c3e18f0a49'
+down_revision: Union[str, Sequence[str], None] = '7f1a9d24c6b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('watchlist_model', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('medias_version', sa.BigInteger(), server_default='0', nullable=False))
+
+    # Bump medias_version alongside medias_count so cached media lists are invalidated
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_watchlist_medias_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND NEW.watchlist_id IS NOT DISTINCT FROM OLD.watchlist_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE watchlist_model
+                SET medias_count = medias_count + 1, medias_version = medias_version + 1
+                WHERE id = NEW.watchlist_id;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE watchlist_model
+                SET medias_count = medias_count - 1, medias_version = medias_version + 1
+                WHERE id = OLD.watchlist_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_watchlist_medias_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' AND NEW.watchlist_id IS NOT DISTINCT FROM OLD.watchlist_id THEN
+                RETURN NULL;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE watchlist_model SET medias_count = medias_count + 1 WHERE id = NEW.watchlist_id;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE watchlist_model SET medias_count = medias_count - 1 WHERE id = OLD.watchlist_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    with op.batch_alter_table('watchlist_model', schema=None) as batch_op:
+        batch_op.drop_column('medias_version')
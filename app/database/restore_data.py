@@ -4,33 +4,22 @@ No filtering or mapping needed (dump must already be ready).
 """
 
 import logging
+import re
 import sys
 import subprocess
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+import psycopg2
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.settings import settings
+from app.database.maintenance import get_local_tables, refresh_watchlist_medias_counts, run_streaming
 
 logger = logging.getLogger(__name__)
 
-def get_local_tables() -> List[str]:
-    """Return list of tables in local DB (public schema)."""
-    container_name = settings.DB_CONTAINER_NAME
-    try:
-        command = [
-            'docker', 'exec', container_name,
-            'psql', '-U', settings.POSTGRES_USER, '-d', settings.POSTGRES_DB,
-            '-t', '-c',
-            "SELECT tablename FROM pg_tables WHERE schemaname = 'public' ORDER BY tablename;"
-        ]
-        result = subprocess.run(command, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
-            logger.error(f"Could not get table names: {result.stderr}")
-            return []
-        return [line.strip() for line in result.stdout.splitlines() if line.strip()]
-    except Exception as e:
-        logger.error(f"Error getting table names: {e}")
-        return []
+COPY_STATEMENT_REGEX = re.compile(r"^COPY\s.+\sFROM stdin;\s*$", re.IGNORECASE)
+COPY_END_MARKER = "\\."
 
 def import_dump(dump_path: str) -> bool:
     """Import the cleaned dump into the local DB."""
@@ -44,9 +33,8 @@ def import_dump(dump_path: str) -> bool:
     # Copy dump into container
     temp_file = '/tmp/supabase_import.sql'
     copy_cmd = ['docker', 'cp', str(dump_path), f'{container_name}:{temp_file}']
-    result = subprocess.run(copy_cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        logger.error(f"Failed to copy dump into container: {result.stderr}")
+    if run_streaming(copy_cmd) != 0:
+        logger.error("Failed to copy dump into container")
         return False
 
     # Run import
@@ -56,25 +44,125 @@ def import_dump(dump_path: str) -> bool:
         '-f', temp_file
     ]
     logger.info("📥 Importing dump into database...")
-    result = subprocess.run(import_cmd, capture_output=True, text=True)
+    returncode = run_streaming(import_cmd)
 
     # Cleanup
     subprocess.run(['docker', 'exec', container_name, 'rm', '-f', temp_file])
 
-    if result.returncode != 0:
-        logger.error("Import failed:")
-        logger.error(result.stderr)
+    if returncode != 0:
+        logger.error("Import failed, see psql output above")
         return False
 
     logger.info("✅ Import completed successfully")
     return True
 
+def is_copy_dump(dump_path: Path) -> bool:
+    """Return True if the dump only loads data through COPY ... FROM stdin blocks."""
+    has_copy_block = False
+    in_copy_block = False
+    with dump_path.open(encoding="utf-8") as dump_file:
+        for line in dump_file:
+            if in_copy_block:
+                in_copy_block = line.rstrip("\n") != COPY_END_MARKER
+            elif COPY_STATEMENT_REGEX.match(line):
+                has_copy_block = in_copy_block = True
+            elif line.lstrip().upper().startswith("INSERT INTO") or line.startswith("\\"):
+                # INSERT-based dumps and psql meta-commands need the psql path
+                return False
+    return has_copy_block
+
+
+class CopyBlockReader:
+    """
+    File-like view over one COPY data block of an open dump.
+
+    copy_expert pulls the block through read() in small chunks, so rows go
+    from the dump file to the server without the table being held in memory.
+    Reading stops at the end-of-data marker line.
+    """
+
+    def __init__(self, dump_file: TextIO):
+        self._dump_file = dump_file
+        self._buffer = ""
+        self._exhausted = False
+
+    def read(self, size: int = -1) -> str:
+        """Return up to size characters of the block (all of it if negative)."""
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            line = self._dump_file.readline()
+            if not line or line.rstrip("\n") == COPY_END_MARKER:
+                self._exhausted = True
+            else:
+                self._buffer += line
+
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    def drain(self) -> None:
+        """Skip whatever the consumer left unread, up to the end marker."""
+        while self.read(8192):
+            pass
+
+
+def iter_dump_blocks(dump_path: Path) -> Iterator[Tuple[str, Optional[str], Optional[CopyBlockReader]]]:
+    """Yield (sql, copy_statement, copy_data) chunks from a plain-text COPY dump."""
+    sql_lines: List[str] = []
+    with dump_path.open(encoding="utf-8") as dump_file:
+        for line in iter(dump_file.readline, ""):
+            if line.startswith("--"):
+                continue
+            if not COPY_STATEMENT_REGEX.match(line):
+                sql_lines.append(line)
+                continue
+
+            copy_data = CopyBlockReader(dump_file)
+            yield "".join(sql_lines), line.strip(), copy_data
+            copy_data.drain()
+            sql_lines = []
+
+    yield "".join(sql_lines), None, None
+
+
+def fast_restore(dump_path: str) -> bool:
+    """Import a COPY-only dump in-process over a single connection and transaction."""
+    dump_path = Path(dump_path)
+
+    if not dump_path.exists():
+        logger.error(f"Dump file not found: {dump_path}")
+        return False
+
+    logger.info("📥 Importing dump into database (in-process COPY)...")
+    connection = None
+    try:
+        connection = psycopg2.connect(settings.DATABASE_URL)
+        with connection, connection.cursor() as cursor:
+            for sql, copy_statement, copy_data in iter_dump_blocks(dump_path):
+                if sql.strip():
+                    cursor.execute(sql)
+                if copy_statement is not None:
+                    cursor.copy_expert(copy_statement, copy_data)
+    except psycopg2.Error as e:
+        logger.error(f"Import failed: {e}")
+        return False
+    finally:
+        if connection is not None:
+            connection.close()
+
+    logger.info("✅ Import completed successfully")
+    return True
+
+
 def main():
     print("🔄 Scenario API - Supabase Import (Cleaned)")
     print("=" * 55)
 
-    if len(sys.argv) > 1:
-        dump_path = sys.argv[1]
+    arguments = [argument for argument in sys.argv[1:] if argument not in ("-y", "--yes")]
+    skip_confirmation = len(arguments) != len(sys.argv) - 1
+
+    if arguments:
+        dump_path = arguments[0]
     else:
         project_root = Path(__file__).parent.parent.parent
         dump_path = project_root / "app" / "database" / "backup" / "scenario_dump.sql"
@@ -82,7 +170,15 @@ def main():
     logger.info(f"Using dump: {dump_path}")
 
     # Check local tables
-    tables = get_local_tables()
+    try:
+        tables = get_local_tables()
+    except SQLAlchemyError as e:
+        logger.error(f"Error getting table names: {e}")
+        print(
+            "❌ Could not connect to the database. "
+            "Check DATABASE_URL (the dev container publishes Postgres on localhost:5433)."
+        )
+        sys.exit(1)
     logger.info(f"Local tables: {tables}")
 
     if not tables:
@@ -92,12 +188,18 @@ def main():
     # Confirm
     print("\nThis will import data into your existing tables:")
     print(", ".join(tables))
-    if input("Continue? (y/N): ").strip().lower() not in ['y', 'yes']:
+    if not skip_confirmation and input("Continue? (y/N): ").strip().lower() not in ['y', 'yes']:
         print("Cancelled.")
         sys.exit(0)
 
-    # Import
-    if import_dump(str(dump_path)):
+    # Import (COPY-only dumps skip psql entirely)
+    if Path(dump_path).exists() and is_copy_dump(Path(dump_path)):
+        imported = fast_restore(str(dump_path))
+    else:
+        imported = import_dump(str(dump_path))
+
+    # The dump disables the medias_count trigger, so a failed resync is a failed import
+    if imported and refresh_watchlist_medias_counts():
         print("\n✅ Import successful!")
         print("💡 Check with: make db-shell → SELECT COUNT(*) FROM user_model;")
     else:
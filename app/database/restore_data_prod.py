@@ -5,29 +5,16 @@ This version works from within a Docker container.
 
 import logging
 import sys
-import subprocess
 import os
 from pathlib import Path
-from typing import List
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
 from app.core.settings import settings
+from app.database.maintenance import get_local_tables, refresh_watchlist_medias_counts, run_streaming
 
 logger = logging.getLogger(__name__)
 
-def get_local_tables() -> List[str]:
-    """Return list of tables in local DB (public schema)."""
-    try:
-        engine = create_engine(settings.DATABASE_URL)
-        with engine.connect() as connection:
-            result = connection.execute(text(
-                "SELECT tablename FROM pg_tables WHERE schemaname = 'public' ORDER BY tablename;"
-            ))
-            return [row[0] for row in result.fetchall()]
-    except Exception as e:
-        logger.error(f"Error getting table names: {e}")
-        return []
-
 def import_dump(dump_path: str) -> bool:
     """Import the cleaned dump into the database using psql."""
     dump_path = Path(dump_path)
@@ -64,11 +51,8 @@ def import_dump(dump_path: str) -> bool:
     ]
     
     logger.info("📥 Importing dump into database...")
-    result = subprocess.run(import_cmd, capture_output=True, text=True, env=env)
-
-    if result.returncode != 0:
-        logger.error("Import failed:")
-        logger.error(result.stderr)
+    if run_streaming(import_cmd, env=env) != 0:
+        logger.error("Import failed, see psql output above")
         return False
 
     logger.info("✅ Import completed successfully")
@@ -87,7 +71,12 @@ def main():
     logger.info(f"Using dump: {dump_path}")
 
     # Check local tables
-    tables = get_local_tables()
+    try:
+        tables = get_local_tables()
+    except SQLAlchemyError as e:
+        logger.error(f"Error getting table names: {e}")
+        print("❌ Could not connect to the database. Check DATABASE_URL.")
+        sys.exit(1)
     logger.info(f"Local tables: {tables}")
 
     if not tables:
@@ -98,7 +87,8 @@ def main():
     print(", ".join(tables[:5]) + ("..." if len(tables) > 5 else ""))
 
     # Import (no confirmation in production)
-    if import_dump(str(dump_path)):
+    # The dump disables the medias_count trigger, so a failed resync is a failed import
+    if import_dump(str(dump_path)) and refresh_watchlist_medias_counts():
         print("\n✅ Import successful!")
         # Quick verification
         try:
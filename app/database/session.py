@@ -6,27 +6,70 @@ and provides dependency injection for FastAPI endpoints. It ensures proper
 connection pooling and session lifecycle management.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+import os
+from functools import lru_cache
 from typing import Generator
 
+from sqlalchemy import create_engine, Engine
+from sqlalchemy.orm import sessionmaker, Session
+
 from app.core.settings import settings
 
-# Configure SQLAlchemy engine with connection pooling
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,  # Verify connections before use
-    pool_size=10,  # Number of connections to maintain in pool
-    max_overflow=20,  # Additional connections beyond pool_size
-    echo=settings.DEBUG  # Log SQL queries in debug mode
-)
 
-# Create session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Return the process-wide SQLAlchemy engine, creating it on first use.
+
+    The engine is built lazily so importing the application does not set up
+    a connection pool, and each worker process ends up with its own pool.
+
+    Forked children discard the pooled connections inherited from the parent
+    so they never reuse its sockets; they open fresh ones on first checkout.
+
+    The DB_MAX_CONNECTIONS budget is split evenly across the WEB_CONCURRENCY
+    workers so every worker's pool and overflow together stay within it.
+
+    Returns:
+        Engine: SQLAlchemy engine with connection pooling
+    """
+    worker_connections = max(settings.DB_MAX_CONNECTIONS // settings.WEB_CONCURRENCY, 1)
+    pool_size = max(worker_connections // 3, 1)
+
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_pre_ping=True,  # Verify connections before use
+        pool_size=pool_size,  # Number of connections to maintain in pool
+        max_overflow=worker_connections - pool_size,  # Additional connections beyond pool_size
+        pool_recycle=1800,  # Replace connections before idle NAT/firewall timeouts
+        insertmanyvalues_page_size=1000,  # Rows per multi-VALUES INSERT on bulk inserts
+        echo=settings.DEBUG,  # Log SQL queries in debug mode
+        connect_args={
+            # TCP keepalives stop idle pooled connections from being silently dropped
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 5,
+            "application_name": "scenario-api",
+        }
+    )
+    os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker:
+    """
+    Return the session factory bound to the lazily created engine.
+
+    Returns:
+        sessionmaker: Factory producing SQLAlchemy sessions
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine()
+    )
 
 
 def get_database_session() -> Generator[Session, None, None]:
@@ -53,7 +96,8 @@ def get_database_session() -> Generator[Session, None, None]:
         This function is typically used as a FastAPI dependency injection
         and should not be called directly in application code.
     """
-    database_session = SessionLocal()
+    session_factory = get_session_factory()
+    database_session = session_factory()
     try:
         yield database_session
     finally:
@@ -6,10 +6,12 @@ exception handlers, and route configurations. It serves as the entry point
 for the Scenario API application.
 """
 
+import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.core.exception_handlers import register_exception_handlers
-from app.core.middleware import setup_cors
+from app.core.middleware import setup_cors, setup_gzip
 from app.core.settings import settings
 from app.api.v1.router import main_router
 
@@ -18,6 +20,9 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
+    # The schema and interactive docs are only exposed outside production
+    openapi_url="/openapi.json" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
     description="""
     🎬 **Scenario API** - A modern FastAPI application for managing movie and TV show watchlists.
 
@@ -46,6 +51,9 @@ app = FastAPI(
     },
 )
 
+# Setup response compression (added first so CORS stays the outermost layer)
+setup_gzip(app=app)
+
 # Setup CORS middleware
 setup_cors(app=app)
 
@@ -103,4 +111,24 @@ def health_check():
         "status": "healthy",
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION
-    }
\ No newline at end of file
+    }
+
+
+# Build the OpenAPI schema once at startup instead of on the first /docs hit;
+# FastAPI keeps it cached on app.openapi_schema afterwards
+if app.openapi_url:
+    app.openapi()
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=settings.APP_PORT,
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.DEBUG else settings.WEB_CONCURRENCY,
+        backlog=4096,
+        timeout_keep_alive=30,
+    )
@@ -59,14 +59,14 @@ class Media(Base):
     __tablename__ = "media_model"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tmdb_id = Column(Integer, nullable=False, index=True)
+    tmdb_id = Column(Integer, nullable=False)
     genre_ids = Column(ARRAY(Integer), default=[0])
-    poster_path = Column(String, nullable=False)
-    backdrop_path = Column(String, nullable=False)
-    release_date = Column(String, nullable=False)
+    poster_path = Column(String(255), nullable=False)
+    backdrop_path = Column(String(255), nullable=False)
+    release_date = Column(String(10), nullable=False)
     runtime = Column(Integer, nullable=False)
-    title = Column(String, nullable=False)
-    media_type = Column(String, nullable=False, index=True)
+    title = Column(String(512), nullable=False)
+    media_type = Column(String(5), nullable=False)
     watchlist_id = Column(
         UUID(as_uuid=True),
         ForeignKey("watchlist_model.id", ondelete="CASCADE"),
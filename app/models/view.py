@@ -5,7 +5,7 @@ This module defines the View SQLAlchemy model which records when users
 have watched movies or TV shows, enabling viewing history and statistics.
 """
 
-from sqlalchemy import Column, String, Integer, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Integer, ForeignKey, ARRAY, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -60,22 +60,29 @@ class View(Base):
     """
 
     __tablename__ = "view_model"
+    __table_args__ = (
+        # Serves the per-user statistics and history filters
+        # (WHERE viewer_id = ? AND media_type = ? [GROUP BY release_year]);
+        # its viewer_id prefix also serves viewer_id-only lookups and the FK cascade
+        Index("ix_view_viewer_media_year", "viewer_id", "media_type", "release_year"),
+        # Answers genre_ids @> ARRAY[...] filters without scanning the table
+        Index("ix_view_genre_ids_gin", "genre_ids", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     tmdb_id = Column(Integer, nullable=False, index=True)
     genre_ids = Column(ARRAY(Integer), default=[0])
-    poster_path = Column(String, nullable=False)
-    backdrop_path = Column(String, nullable=False)
-    release_date = Column(String, nullable=False)
-    release_year = Column(String, nullable=False, index=True)
+    poster_path = Column(String(255), nullable=False)
+    backdrop_path = Column(String(255), nullable=False)
+    release_date = Column(String(10), nullable=False)
+    release_year = Column(String(4), nullable=False)
     runtime = Column(Integer, nullable=False)
-    title = Column(String, nullable=False)
-    media_type = Column(String, nullable=False, index=True)
+    title = Column(String(512), nullable=False)
+    media_type = Column(String(5), nullable=False)
     viewer_id = Column(
         UUID(as_uuid=True),
         ForeignKey("user_model.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Relationships
@@ -5,7 +5,7 @@ This module defines the Watchlist SQLAlchemy model which allows users
 to create and organize collections of movies and TV shows they want to watch.
 """
 
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import BigInteger, Column, String, Integer, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -26,6 +26,8 @@ class Watchlist(Base):
         id (UUID): Primary key - unique identifier for the watchlist
         title (str): User-defined name/title for the watchlist
         author_id (UUID): Foreign key reference to the User who created this watchlist
+        medias_count (int): Number of media items, maintained by a database trigger
+        medias_version (int): Counter bumped by the same trigger whenever the media set changes
 
     Relationships:
         author: Many-to-one relationship with User model (watchlist owner)
@@ -43,6 +45,10 @@ class Watchlist(Base):
         When a watchlist is deleted, all associated media items are also deleted
         due to the cascade configuration. When a user is deleted, their watchlists
         are automatically deleted as well.
+
+        medias_count and medias_version are kept in sync by the
+        media_model_medias_count trigger (see migrations 0005 and 0007) and
+        must not be written by application code.
     """
 
     __tablename__ = "watchlist_model"
@@ -55,14 +61,18 @@ class Watchlist(Base):
         nullable=False,
         index=True
     )
+    medias_count = Column(Integer, nullable=False, default=0, server_default="0")
+    medias_version = Column(BigInteger, nullable=False, default=0, server_default="0")
 
     # Relationships
     author = relationship("User", back_populates="watchlists")
+    # Plain lazy loading: list routes opt into selectinload() explicitly so
+    # ownership checks that only need the watchlist row don't load its medias
     medias = relationship(
         "Media",
         back_populates="watchlist",
         cascade="all, delete-orphan",
-        lazy="dynamic"
+        lazy="select"
     )
 
     def __str__(self):
@@ -1,43 +1,39 @@
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 from app.core.settings import settings
-from app.schemas.validation_types import ValidEmail, ValidPassword
+from app.schemas.validation_types import LookupEmail, ValidEmail, ValidPassword, passwords_match
+
+# Length limits bound once at import time
+_USERNAME_MIN_LENGTH = settings.USERNAME_MIN_LENGTH
+_USERNAME_MAX_LENGTH = settings.USERNAME_MAX_LENGTH
+_PASSWORD_MIN_LENGTH = settings.PASSWORD_MIN_LENGTH
+_PASSWORD_MAX_LENGTH = settings.PASSWORD_MAX_LENGTH
 
 
 class UserRegister(BaseModel):
-    username: str = Field(..., min_length=settings.USERNAME_MIN_LENGTH, max_length=settings.USERNAME_MAX_LENGTH)
+    username: str = Field(..., min_length=_USERNAME_MIN_LENGTH, max_length=_USERNAME_MAX_LENGTH)
     email: ValidEmail = Field(..., max_length=255)
-    password: ValidPassword = Field(..., min_length=settings.PASSWORD_MIN_LENGTH, max_length=settings.PASSWORD_MAX_LENGTH)
+    password: ValidPassword = Field(..., min_length=_PASSWORD_MIN_LENGTH, max_length=_PASSWORD_MAX_LENGTH)
     confirm_password: ValidPassword
 
-    @field_validator('confirm_password')
-    @classmethod
-    def passwords_match(cls, value, info) -> str:
-        if 'password' in info.data and value != info.data['password']:
-            raise ValueError('Les mots de passe ne correspondent pas')
-        return value
+    _passwords_match = model_validator(mode="after")(passwords_match)
 
 
 class UserLogin(BaseModel):
-    email: ValidEmail
+    email: LookupEmail
     password: str
 
 
 class PasswordReset(BaseModel):
-    password: ValidPassword = Field(..., min_length=settings.PASSWORD_MIN_LENGTH, max_length=settings.PASSWORD_MAX_LENGTH)
+    password: ValidPassword = Field(..., min_length=_PASSWORD_MIN_LENGTH, max_length=_PASSWORD_MAX_LENGTH)
     confirm_password: ValidPassword
     password_token: str
 
-    @field_validator('confirm_password')
-    @classmethod
-    def passwords_match(cls, value, info) -> str:
-        if 'password' in info.data and value != info.data['password']:
-            raise ValueError('Les mots de passe ne correspondent pas')
-        return value
+    _passwords_match = model_validator(mode="after")(passwords_match)
 
 
 class ForgottenPassword(BaseModel):
-    email: EmailStr
+    email: LookupEmail
 
 
 class Token(BaseModel):
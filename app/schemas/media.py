@@ -1,17 +1,17 @@
-from pydantic import BaseModel, ConfigDict
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional
 from uuid import UUID
 
 
 class MediaBase(BaseModel):
     tmdb_id: int
     genre_ids: List[int] = [0]
-    poster_path: str
-    backdrop_path: str
-    release_date: str
+    poster_path: str = Field(..., max_length=255)
+    backdrop_path: str = Field(..., max_length=255)
+    release_date: str = Field(..., max_length=10)
     runtime: int
-    title: str
-    media_type: str
+    title: str = Field(..., max_length=512)
+    media_type: Literal["movie", "tv"]
 
 
 class MediaCreate(MediaBase):
@@ -37,5 +37,7 @@ class MediaResponse(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        str_strip_whitespace=True
+        str_strip_whitespace=True,
+        frozen=True,
+        extra="forbid"
     )
\ No newline at end of file
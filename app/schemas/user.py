@@ -1,8 +1,8 @@
-from pydantic import BaseModel, field_validator, Field, ConfigDict
+from pydantic import BaseModel, model_validator, Field, ConfigDict
 from typing import Optional
 from uuid import UUID
 
-from app.schemas.validation_types import ValidPassword, ValidEmail
+from app.schemas.validation_types import ValidPassword, ValidEmail, passwords_match
 
 
 class UserBase(BaseModel):
@@ -28,12 +28,7 @@ class UserUpdatePassword(BaseModel):
     password: ValidPassword = Field(..., min_length=7, max_length=30)
     confirm_password: str
 
-    @field_validator('confirm_password')
-    @classmethod
-    def passwords_match(cls, v, info):
-        if 'password' in info.data and v != info.data['password']:
-            raise ValueError('Les mots de passe ne correspondent pas')
-        return v
+    _passwords_match = model_validator(mode="after")(passwords_match)
 
 
 class UserUpdateBanner(BaseModel):
@@ -49,7 +44,9 @@ class UserResponse(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        str_strip_whitespace=True
+        str_strip_whitespace=True,
+        frozen=True,
+        extra="forbid"
     )
 
 
@@ -61,7 +58,9 @@ class UserPublic(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        str_strip_whitespace=True
+        str_strip_whitespace=True,
+        frozen=True,
+        extra="forbid"
     )
 
 
@@ -2,8 +2,10 @@
 Validation type.
 """
 import re
+from functools import lru_cache
 from typing import Annotated
 
+from email_validator import EmailNotValidError, validate_email
 from pydantic import BeforeValidator
 
 from app.core.exceptions.custom_exception import CustomExceptionError
@@ -12,12 +14,30 @@ from app.services.constant.response_constant import (
     PASSWORD_MISSING_UPPERCASE_ERROR,
     PASSWORD_MISSING_DIGIT_ERROR,
     PASSWORD_MISSING_SPECIAL_CHARACTER_ERROR,
+    PASSWORDS_DO_NOT_MATCH_ERROR,
     INVALID_EMAIL_ERROR,
 )
 
-EMAIL_REGEX = re.compile(
+# Historical syntax check; lookups accept anything it accepted so accounts
+# stored before the stricter email-validator check can still sign in
+LOOKUP_EMAIL_REGEX = re.compile(
     r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
 )
+DIGIT_REGEX = re.compile(r"\d")
+SPECIAL_CHARACTER_REGEX = re.compile(r"[!@#$%^&*()\-+]")
+
+
+@lru_cache(maxsize=1024)
+def _email_syntax_is_valid(email: str) -> bool:
+    """
+    Check the email syntax with email-validator, the same library behind EmailStr.
+    Results are cached since the same addresses come back on every login.
+    """
+    try:
+        validate_email(email, check_deliverability=False)
+    except EmailNotValidError:
+        return False
+    return True
 
 
 def email_is_valid(email: str) -> str:
@@ -29,7 +49,24 @@ def email_is_valid(email: str) -> str:
     """
     email = email.strip()
 
-    if not EMAIL_REGEX.match(email):
+    if not _email_syntax_is_valid(email):
+        raise CustomExceptionError(INVALID_EMAIL_ERROR)
+
+    return email
+
+
+def lookup_email_is_valid(email: str) -> str:
+    """
+    Validate an email address used to look up an existing account.
+    Falls back to the historical regex when email-validator rejects the
+    address (e.g. "john..doe@gmail.com" or "a@mail.test").
+    :param email: Email address to validate.
+    :return: The stripped email address if valid.
+    :raises CustomExceptionError: If the email is invalid.
+    """
+    email = email.strip()
+
+    if not _email_syntax_is_valid(email) and not LOOKUP_EMAIL_REGEX.match(email):
         raise CustomExceptionError(INVALID_EMAIL_ERROR)
 
     return email
@@ -44,16 +81,38 @@ def password_is_valid(password: str) -> str:
     Returns:
         ValueError or password
     """
-    if not any(char.isdigit() for char in password):
+    # Each check is a single C-level pass instead of a per-character loop.
+    # Identical to isdigit()/isupper()/islower() for ASCII, but not for every
+    # Unicode character: \d only matches decimal digits (not "²"), titlecase
+    # letters such as "ǅ" count as upper case, and letters without a case
+    # mapping such as "ª" do not count as lower case
+    if not DIGIT_REGEX.search(password):
         raise CustomExceptionError(PASSWORD_MISSING_DIGIT_ERROR)
-    if not any(char.isupper() for char in password):
+    if password.lower() == password:
         raise CustomExceptionError(PASSWORD_MISSING_UPPERCASE_ERROR)
-    if not any(char.islower() for char in password):
+    if password.upper() == password:
         raise CustomExceptionError(PASSWORD_MISSING_LOWER_CASE_ERROR)
-    if not any(char in "!@#$%^&*()-+" for char in password):
+    if not SPECIAL_CHARACTER_REGEX.search(password):
         raise CustomExceptionError(PASSWORD_MISSING_SPECIAL_CHARACTER_ERROR)
     return password
 
 
+def passwords_match(model):
+    """
+    Check that password and confirm_password are identical.
+    Attached to models with model_validator(mode="after"), so it runs once
+    on the built model instead of per field.
+    Args:
+        model: Validated model holding password and confirm_password.
+
+    Returns:
+        CustomExceptionError or model
+    """
+    if model.password != model.confirm_password:
+        raise CustomExceptionError(PASSWORDS_DO_NOT_MATCH_ERROR)
+    return model
+
+
 ValidEmail = Annotated[str, BeforeValidator(email_is_valid)]
+LookupEmail = Annotated[str, BeforeValidator(lookup_email_is_valid)]
 ValidPassword = Annotated[str, BeforeValidator(password_is_valid)]
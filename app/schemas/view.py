@@ -1,18 +1,18 @@
-from pydantic import BaseModel, ConfigDict
-from typing import List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal
 from uuid import UUID
 
 
 class ViewBase(BaseModel):
     tmdb_id: int
     genre_ids: List[int] = [0]
-    poster_path: str
-    backdrop_path: str
-    release_date: str
-    release_year: str
+    poster_path: str = Field(..., max_length=255)
+    backdrop_path: str = Field(..., max_length=255)
+    release_date: str = Field(..., max_length=10)
+    release_year: str = Field(..., max_length=4)
     runtime: int
-    title: str
-    media_type: str
+    title: str = Field(..., max_length=512)
+    media_type: Literal["movie", "tv"]
 
 
 class ViewCreate(ViewBase):
@@ -35,7 +35,9 @@ class ViewResponse(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        str_strip_whitespace=True
+        str_strip_whitespace=True,
+        frozen=True,
+        extra="forbid"
     )
 
 class ViewCountByType(BaseModel):
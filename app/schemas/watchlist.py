@@ -24,7 +24,9 @@ class MediaInWatchlist(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        str_strip_whitespace=True
+        str_strip_whitespace=True,
+        frozen=True,
+        extra="forbid"
     )
 
 
@@ -38,7 +40,9 @@ class WatchlistResponse(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         populate_by_name=True,
-        str_strip_whitespace=True
+        str_strip_whitespace=True,
+        frozen=True,
+        extra="forbid"
     )
 
 
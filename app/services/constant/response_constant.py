@@ -87,3 +87,9 @@ USER_NOT_ALLOWED_ERROR = {
     "message": "User not allowed.",
     "status_code": status.HTTP_403_FORBIDDEN,
 }
+
+PASSWORDS_DO_NOT_MATCH_ERROR = {
+    "key": "passwords_do_not_match_error_key",
+    "message": "Passwords do not match.",
+    "status_code": status.HTTP_400_BAD_REQUEST,
+}
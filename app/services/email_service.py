@@ -6,6 +6,7 @@ such as password reset notifications using FastAPI Mail.
 """
 
 from app.core.email import send_email
+from app.core.logger import log
 from app.utils.email_templates import get_password_reset_template
 
 
@@ -17,6 +18,9 @@ async def send_forgotten_password_email(user_email: str, username: str, reset_to
     to the user's registered email address. The email includes the user's username
     and a secure reset token for password recovery.
 
+    This runs as a background task after the response has been sent, so
+    failures are logged instead of raised.
+
     Args:
         user_email: Recipient's email address
         username: User's display name for personalization
@@ -25,9 +29,6 @@ async def send_forgotten_password_email(user_email: str, username: str, reset_to
     Returns:
         None
 
-    Raises:
-        Exception: If email sending fails due to SMTP issues or invalid configuration
-
     Example:
         >>> await send_forgotten_password_email(
         ...     user_email="user@example.com",
@@ -37,8 +38,11 @@ async def send_forgotten_password_email(user_email: str, username: str, reset_to
     """
     html_content = get_password_reset_template(username, reset_token)
 
-    await send_email(
-        subject=f"{username}, have you forgotten your password?",
-        email_to=[user_email],
-        body=html_content,
-    )
\ No newline at end of file
+    try:
+        await send_email(
+            subject=f"{username}, have you forgotten your password?",
+            email_to=[user_email],
+            body=html_content,
+        )
+    except Exception as error:
+        log.error(f"Failed to send password reset email: {error}")
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+In-process caching utilities.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with a per-entry time to live.
+
+    Entries are evicted when the cache grows past maxsize or once they are
+    older than ttl seconds. Keys should embed a version so that writes
+    invalidate by changing the key rather than by deleting entries.
+
+    Example:
+        >>> cache = LRUCache(maxsize=128, ttl=60)
+        >>> cache.set(("watchlist", 1), [1, 2, 3])
+        >>> cache.get(("watchlist", 1))
+        [1, 2, 3]
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -1,18 +1,13 @@
+from string import Template
+
 from app.core.settings import settings
 
+# Static configuration bound once at import time
+_FRONTEND_URL = settings.FRONTEND_URL
+_MAIL_FROM = settings.MAIL_FROM
 
-def get_password_reset_template(username: str, reset_token: str) -> str:
-    """
-    Génère le template HTML pour l'email de réinitialisation de mot de passe.
 
-    Args:
-        username: Nom d'utilisateur
-        reset_token: Token de réinitialisation
-
-    Returns:
-        Template HTML complet
-    """
-    return f"""
+_PASSWORD_RESET_HTML = """
     <!DOCTYPE html>
     <html lang="en">
       <head>
@@ -53,14 +48,14 @@ def get_password_reset_template(username: str, reset_token: str) -> str:
               font-family: 'Abril Fatface', serif;
             "
           >
-            Hey {username},
+            Hey $username,
           </h1>
           <h2 style="font-size: 1rem; font-weight: 400">
             You need to change your SCENARIO password ?
           </h2>
         </section>
         <a
-          href="{settings.FRONTEND_URL}/reset-password/{reset_token}"
+          href="$frontend_url/reset-password/$reset_token"
           style="
             border: 1px solid #eab208;
             border-radius: 0.375rem;
@@ -82,7 +77,7 @@ def get_password_reset_template(username: str, reset_token: str) -> str:
         <p style="text-align: center; font-size: 1rem">
           If you did not initiate this request, please contact us immediately at
           <a
-            href="mailto:{settings.MAIL_FROM}"
+            href="mailto:$mail_from"
             style="
               text-decoration-line: underline;
               text-underline-offset: 4px;
@@ -90,7 +85,7 @@ def get_password_reset_template(username: str, reset_token: str) -> str:
               text-decoration-color: #eab208;
               color: black;
             "
-            >{settings.MAIL_FROM}</a
+            >$mail_from</a
           >.
         </p>
         <p style="text-align: center; font-size: 1rem">
@@ -104,4 +99,50 @@ def get_password_reset_template(username: str, reset_token: str) -> str:
         />
       </body>
     </html>
-    """
\ No newline at end of file
+    """
+
+# Static settings are filled in once at import, then the document is split
+# around the username and reset token and pre-encoded to UTF-8 bytes
+_PASSWORD_RESET_PREFIX, _PASSWORD_RESET_MIDDLE, _PASSWORD_RESET_SUFFIX = (
+    fragment.encode("utf-8")
+    for fragment in Template(_PASSWORD_RESET_HTML).substitute(
+        username="\x00",
+        reset_token="\x00",
+        frontend_url=_FRONTEND_URL,
+        mail_from=_MAIL_FROM,
+    ).split("\x00")
+)
+
+
+def get_password_reset_template_bytes(username: str, reset_token: str) -> bytes:
+    """
+    Génère le template HTML encodé en UTF-8 pour l'email de réinitialisation.
+
+    Args:
+        username: Nom d'utilisateur
+        reset_token: Token de réinitialisation
+
+    Returns:
+        Template HTML complet en bytes
+    """
+    return b"".join((
+        _PASSWORD_RESET_PREFIX,
+        username.encode("utf-8"),
+        _PASSWORD_RESET_MIDDLE,
+        reset_token.encode("utf-8"),
+        _PASSWORD_RESET_SUFFIX,
+    ))
+
+
+def get_password_reset_template(username: str, reset_token: str) -> str:
+    """
+    Génère le template HTML pour l'email de réinitialisation de mot de passe.
+
+    Args:
+        username: Nom d'utilisateur
+        reset_token: Token de réinitialisation
+
+    Returns:
+        Template HTML complet
+    """
+    return get_password_reset_template_bytes(username, reset_token).decode("utf-8")
@@ -0,0 +1,27 @@
+"""
+Response helpers for list endpoints.
+"""
+from typing import Any, Iterable
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_list_response(adapter: TypeAdapter, rows: Iterable[Any]) -> Response:
+    """
+    Serialize ORM rows to a JSON array in one pydantic-core pass.
+
+    Rows are validated against the adapter's list type (reading ORM attributes)
+    and dumped straight to bytes, skipping FastAPI's second response_model
+    validation and its jsonable_encoder dict walk. Routes keep declaring
+    response_model so the OpenAPI schema is unchanged.
+
+    Args:
+        adapter: TypeAdapter for a list of response models, built once per module
+        rows: ORM rows to serialize
+
+    Returns:
+        Response: application/json response holding the encoded array
+    """
+    items = adapter.validate_python(rows, from_attributes=True)
+    return Response(content=adapter.dump_json(items), media_type="application/json")
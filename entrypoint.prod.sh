@@ -22,4 +22,11 @@ fi
 
 # Start the application
 echo "🏃 Starting FastAPI application..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 8000
\ No newline at end of file
+exec uvicorn app.main:app \
+    --host 0.0.0.0 \
+    --port 8000 \
+    --loop uvloop \
+    --http httptools \
+    --workers "${WEB_CONCURRENCY:-2}" \
+    --backlog 4096 \
+    --timeout-keep-alive 30
\ No newline at end of file
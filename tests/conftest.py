@@ -1,60 +1,151 @@
+import json
+import os
+import sqlite3
+import sys
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import ARRAY, create_engine, event, insert
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
-from app.main import app
-from app.core.database import get_database_session, Base
-from app.models import User
-from app.core.security import hash_password
+# Doit être défini avant le chargement des settings
+os.environ.setdefault("FAST_PASSWORD_HASH_FOR_TESTS", "1")
 
-# Base de données en mémoire pour les tests
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+from app.main import app  # noqa: E402
+from app.api.dependencies import get_database  # noqa: E402
+from app.database.base import Base  # noqa: E402
+from app.models import User  # noqa: E402
+from app.core.security import hash_password  # noqa: E402
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
+# Boucle uvloop pour le portail anyio du TestClient (indisponible sous Windows)
+TEST_CLIENT_BACKEND_OPTIONS = {"use_uvloop": sys.platform != "win32"}
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# SQLite n'a pas de type ARRAY : les colonnes genre_ids sont déclarées JSON,
+# les listes sont sérialisées à l'écriture et relues via le convertisseur JSON
+@compiles(ARRAY, "sqlite")
+def _compile_array_sqlite(type_, compiler, **kw):
+    return "JSON"
 
-def override_get_database():
-    try:
-        database_session = TestingSessionLocal()
-        yield database_session
-    finally:
-        database_session.close()
 
+sqlite3.register_adapter(list, json.dumps)
+sqlite3.register_converter("JSON", json.loads)
+
+
+# pysqlite gère mal les SAVEPOINT : on désactive sa gestion des transactions
+# pour laisser SQLAlchemy émettre BEGIN lui-même
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+    # Sans effet en mémoire, mais évite les fsync si on repasse sur un fichier
+    dbapi_connection.execute("PRAGMA synchronous=OFF")
+    dbapi_connection.execute("PRAGMA journal_mode=MEMORY")
+
+
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def _engine():
+    """
+    Base en mémoire propre à chaque worker pytest-xdist (pytest -n auto),
+    schéma créé une seule fois pour toute la session de tests.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    engine = create_engine(
+        f"sqlite:///file:memdb_{worker}?mode=memory&cache=shared&uri=true",
+        connect_args={"check_same_thread": False, "detect_types": sqlite3.PARSE_DECLTYPES},
+        poolclass=StaticPool,
+    )
+    event.listen(engine, "connect", _configure_sqlite_connection)
+    event.listen(engine, "begin", _emit_begin)
 
-@pytest.fixture
-def database_session():
     Base.metadata.create_all(bind=engine)
-    database_session = TestingSessionLocal()
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def database_session(_engine):
+    """Session liée à une transaction externe annulée à la fin de chaque test."""
+    connection = _engine.connect()
+    transaction = connection.begin()
+    database_session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
     try:
         yield database_session
     finally:
         database_session.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
-@pytest.fixture
-def client(database_session):
-    app.dependency_overrides[get_database_session] = override_get_database
-    with TestClient(app) as test_client:
+# Session de base du test en cours, servie par la surcharge de get_database
+_current_database_session = None
+
+
+def _override_get_database():
+    yield _current_database_session
+
+
+@pytest.fixture(scope="session")
+def _client():
+    """Un seul TestClient (et un seul lifespan) pour toute la session."""
+    app.dependency_overrides[get_database] = _override_get_database
+    with TestClient(app, backend_options=TEST_CLIENT_BACKEND_OPTIONS) as test_client:
         yield test_client
+    app.dependency_overrides.pop(get_database, None)
+
+
+@pytest.fixture
+def client(_client, database_session):
+    global _current_database_session
+    _current_database_session = database_session
+    _client.cookies.clear()
+    yield _client
+    _current_database_session = None
+
+
+@pytest.fixture(scope="session")
+def _hashed_password():
+    """Hash rapide (sha256, FAST_PASSWORD_HASH_FOR_TESTS) calculé une seule fois pour la session."""
+    return hash_password("testpassword123")
 
 
 @pytest.fixture
-def test_user(database_session):
-    user = User(
+def test_user(database_session, _hashed_password):
+    """Utilisateur inséré via Core ; les tests ne lisent que id, username et email."""
+    statement = insert(User).values(
         username="testuser",
         email="test@example.com",
-        hashed_password=hash_password("testpassword123")
-    )
-    database_session.add(user)
+        hashed_password=_hashed_password
+    ).returning(User.id, User.username, User.email)
+    row = database_session.execute(statement).one()
     database_session.commit()
-    database_session.refresh(user)
-    return user
\ No newline at end of file
+    return SimpleNamespace(id=row.id, username=row.username, email=row.email)
+
+
+@pytest.fixture
+def make_users(database_session, _hashed_password):
+    """Insère n utilisateurs en un seul INSERT et un seul commit."""
+    def _make_users(n):
+        rows = [
+            {
+                "username": f"user{i}",
+                "email": f"user{i}@example.com",
+                "hashed_password": _hashed_password,
+            }
+            for i in range(n)
+        ]
+        database_session.bulk_insert_mappings(User, rows)
+        database_session.commit()
+        return rows
+
+    return _make_users
@@ -1,17 +1,52 @@
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.exceptions.custom_exception import CustomExceptionError
+from app.core.security import hash_password, verify_password
+from app.schemas.auth import UserLogin, UserRegister
+from app.core.settings import settings
+
+# Corps JSON sérialisés une seule fois au chargement du module
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_REGISTER_BODY = orjson.dumps({
+    "username": "newuser",
+    "email": "newuser@example.com",
+    "password": "Password123!",
+    "confirm_password": "Password123!"
+})
+_REGISTER_DUPLICATE_EMAIL_BODY = orjson.dumps({
+    "username": "anothuser",
+    "email": "test@example.com",  # Email déjà utilisé
+    "password": "Password123!",
+    "confirm_password": "Password123!"
+})
+_LOGIN_BODY = orjson.dumps({
+    "email": "test@example.com",
+    "password": "testpassword123"
+})
+_LOGIN_WRONG_PASSWORD_BODY = orjson.dumps({
+    "email": "test@example.com",
+    "password": "wrongpassword"
+})
+
+
+@pytest.mark.slow
+def test_password_hashing(monkeypatch):
+    """Test du hachage réel (bcrypt) des mots de passe."""
+    monkeypatch.setattr(settings, "FAST_PASSWORD_HASH_FOR_TESTS", False)
+    hashed_password = hash_password("testpassword123")
+    assert hashed_password.startswith("$2b$")
+    assert verify_password("testpassword123", hashed_password)
+    assert not verify_password("wrongpassword", hashed_password)
+
 
 def test_register_user(client: TestClient):
     """Test d'inscription d'un nouvel utilisateur."""
     response = client.post(
-        "/api/v1/auth/register",
-        json={
-            "username": "newuser",
-            "email": "newuser@example.com",
-            "password": "password123",
-            "confirm_password": "password123"
-        }
+        "/api/v1/auth/auth/register",
+        content=_REGISTER_BODY,
+        headers=_JSON_HEADERS
     )
     assert response.status_code == 201
     assert response.json()["message"] == "User created successfully"
@@ -20,13 +55,9 @@ def test_register_user(client: TestClient):
 def test_register_user_duplicate_email(client: TestClient, test_user):
     """Test d'inscription avec un email déjà existant."""
     response = client.post(
-        "/api/v1/auth/register",
-        json={
-            "username": "anothuser",
-            "email": "test@example.com",  # Email déjà utilisé
-            "password": "password123",
-            "confirm_password": "password123"
-        }
+        "/api/v1/auth/auth/register",
+        content=_REGISTER_DUPLICATE_EMAIL_BODY,
+        headers=_JSON_HEADERS
     )
     assert response.status_code == 400
     assert "already exists" in response.json()["detail"]
@@ -35,11 +66,9 @@ def test_register_user_duplicate_email(client: TestClient, test_user):
 def test_login_user(client: TestClient, test_user):
     """Test de connexion d'un utilisateur."""
     response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "test@example.com",
-            "password": "testpassword123"
-        }
+        "/api/v1/auth/auth/login",
+        content=_LOGIN_BODY,
+        headers=_JSON_HEADERS
     )
     assert response.status_code == 200
     data = response.json()
@@ -51,11 +80,9 @@ def test_login_user(client: TestClient, test_user):
 def test_login_invalid_credentials(client: TestClient, test_user):
     """Test de connexion avec des identifiants invalides."""
     response = client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "test@example.com",
-            "password": "wrongpassword"
-        }
+        "/api/v1/auth/auth/login",
+        content=_LOGIN_WRONG_PASSWORD_BODY,
+        headers=_JSON_HEADERS
     )
     assert response.status_code == 401
     assert response.json()["detail"] == "Invalid credentials"
@@ -63,6 +90,18 @@ def test_login_invalid_credentials(client: TestClient, test_user):
 
 def test_logout_user(client: TestClient):
     """Test de déconnexion."""
-    response = client.get("/api/v1/auth/logout")
+    response = client.get("/api/v1/auth/auth/logout")
     assert response.status_code == 200
-    assert response.json()["message"] == "Logged out successfully"
\ No newline at end of file
+    assert response.json()["message"] == "Logged out successfully"
+
+
+def test_login_accepts_legacy_email():
+    """Test qu'un email accepté par l'ancienne regex reste utilisable à la connexion."""
+    assert UserLogin(email="john..doe@gmail.com", password="x").email == "john..doe@gmail.com"
+    with pytest.raises(CustomExceptionError):
+        UserRegister(
+            username="johndoe",
+            email="john..doe@gmail.com",
+            password="Password1!",
+            confirm_password="Password1!"
+        )
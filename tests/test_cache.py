@@ -0,0 +1,40 @@
+from app.utils import cache as cache_module
+from app.utils.cache import LRUCache
+
+
+def test_cache_entry_expires_after_ttl(monkeypatch):
+    """Test de l'expiration d'une entrée après son TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(maxsize=8, ttl=60)
+
+    cache.set("key", "value")
+    now[0] += 59
+    assert cache.get("key") == "value"
+
+    now[0] += 2
+    assert cache.get("key") is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Test de l'éviction de l'entrée la moins récemment utilisée au-delà de maxsize."""
+    cache = LRUCache(maxsize=2, ttl=60)
+
+    cache.set("first", 1)
+    cache.set("second", 2)
+    assert cache.get("first") == 1  # "second" devient la moins récente
+    cache.set("third", 3)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+
+
+def test_cache_misses_after_version_bump():
+    """Test d'un défaut de cache après incrément de la version de la clé."""
+    cache = LRUCache(maxsize=8, ttl=60)
+    watchlist_id, genre = "watchlist", None
+
+    cache.set((watchlist_id, genre, 1), "[]")
+    assert cache.get((watchlist_id, genre, 1)) == "[]"
+    assert cache.get((watchlist_id, genre, 2)) is None
@@ -0,0 +1,57 @@
+from app.database.restore_data import iter_dump_blocks, is_copy_dump
+
+COPY_DUMP = """--
+-- PostgreSQL database dump
+--
+SET session_replication_role = replica;
+
+COPY public.user_model (id, username) FROM stdin;
+1\tfirst
+2\tsecond
+\\.
+
+COPY public.watchlist_model (id, title) FROM stdin;
+1\tto watch
+\\.
+
+SELECT pg_catalog.setval('public.user_model_id_seq', 2, true);
+"""
+
+INSERT_DUMP = """SET session_replication_role = replica;
+INSERT INTO public.user_model (id, username) VALUES (1, 'first');
+"""
+
+
+def test_is_copy_dump(tmp_path):
+    """Test de détection des dumps à base de COPY."""
+    copy_dump = tmp_path / "copy.sql"
+    copy_dump.write_text(COPY_DUMP, encoding="utf-8")
+    insert_dump = tmp_path / "insert.sql"
+    insert_dump.write_text(INSERT_DUMP, encoding="utf-8")
+
+    assert is_copy_dump(copy_dump)
+    assert not is_copy_dump(insert_dump)
+
+
+def test_iter_dump_blocks(tmp_path):
+    """Test du découpage d'un dump COPY en blocs SQL et données."""
+    copy_dump = tmp_path / "copy.sql"
+    copy_dump.write_text(COPY_DUMP, encoding="utf-8")
+
+    blocks = iter_dump_blocks(copy_dump)
+
+    sql, copy_statement, copy_data = next(blocks)
+    assert sql.strip() == "SET session_replication_role = replica;"
+    assert copy_statement == "COPY public.user_model (id, username) FROM stdin;"
+    # Lecture par petits morceaux, comme copy_expert
+    assert copy_data.read(4) + copy_data.read(-1) == "1\tfirst\n2\tsecond\n"
+
+    sql, copy_statement, copy_data = next(blocks)
+    assert sql.strip() == ""
+    assert copy_statement == "COPY public.watchlist_model (id, title) FROM stdin;"
+    # Bloc laissé non lu : il doit être sauté jusqu'au marqueur de fin
+
+    sql, copy_statement, copy_data = next(blocks)
+    assert sql.strip() == "SELECT pg_catalog.setval('public.user_model_id_seq', 2, true);"
+    assert copy_statement is None
+    assert copy_data is None
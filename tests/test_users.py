@@ -1,10 +1,11 @@
-import pytest
 from fastapi.testclient import TestClient
 
+from app.models import User
+
 
 def test_get_user(client: TestClient, test_user):
     """Test de récupération des informations d'un utilisateur."""
-    response = client.get(f"/api/v1/users/{test_user.id}")
+    response = client.get(f"/api/v1/users/users/{test_user.id}")
     assert response.status_code == 200
     data = response.json()
     assert data["username"] == "testuser"
@@ -14,6 +15,23 @@ def test_get_user(client: TestClient, test_user):
 def test_get_nonexistent_user(client: TestClient):
     """Test de récupération d'un utilisateur inexistant."""
     fake_uuid = "12345678-1234-5678-1234-567812345678"
-    response = client.get(f"/api/v1/users/{fake_uuid}")
+    response = client.get(f"/api/v1/users/users/{fake_uuid}")
     assert response.status_code == 404
-    assert response.json()["detail"] == "User not found"
\ No newline at end of file
+    assert response.json()["detail"] == "User not found"
+
+
+def test_get_users_created_in_bulk(client: TestClient, test_user, make_users, database_session):
+    """Test de récupération d'utilisateurs insérés en masse après un appel à l'API."""
+    response = client.get(f"/api/v1/users/users/{test_user.id}")
+    assert response.status_code == 200
+
+    rows = make_users(2)
+    users = database_session.query(User).filter(
+        User.email.in_([row["email"] for row in rows])
+    ).all()
+    assert len(users) == 2
+
+    for user in users:
+        response = client.get(f"/api/v1/users/users/{user.id}")
+        assert response.status_code == 200
+        assert response.json()["username"] == user.username
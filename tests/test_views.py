@@ -0,0 +1,70 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.dependencies import get_current_user
+from app.api.v1.views import VIEWS_BULK_MAX_SIZE
+from app.models import View
+
+_BULK_URL = "/api/v1/views/views/bulk"
+
+
+def _view(viewer_id, tmdb_id=550):
+    return {
+        "tmdb_id": tmdb_id,
+        "genre_ids": [18, 53],
+        "poster_path": "/poster.jpg",
+        "backdrop_path": "/backdrop.jpg",
+        "release_date": "1999-10-15",
+        "release_year": "1999",
+        "runtime": 139,
+        "title": "Fight Club",
+        "media_type": "movie",
+        "viewer_id": str(viewer_id)
+    }
+
+
+@pytest.fixture
+def authenticated_client(client, test_user):
+    """Client authentifié en tant que test_user."""
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    yield client
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def test_add_views_bulk(authenticated_client: TestClient, test_user, database_session):
+    """Test d'ajout de plusieurs visionnages en une requête."""
+    response = authenticated_client.post(
+        _BULK_URL,
+        json=[_view(test_user.id, 550), _view(test_user.id, 551)]
+    )
+    assert response.status_code == 201
+    assert response.json() == {"message": "Views added successfully", "count": 2}
+    assert database_session.query(View).filter(View.viewer_id == test_user.id).count() == 2
+
+
+def test_add_views_bulk_other_user(authenticated_client: TestClient, test_user, database_session):
+    """Test d'ajout en masse refusé si un visionnage cible un autre utilisateur."""
+    response = authenticated_client.post(
+        _BULK_URL,
+        json=[_view(test_user.id), _view("12345678-1234-5678-1234-567812345678")]
+    )
+    assert response.status_code == 403
+    assert database_session.query(View).count() == 0
+
+
+def test_add_views_bulk_empty(authenticated_client: TestClient):
+    """Test d'ajout en masse d'une liste vide."""
+    response = authenticated_client.post(_BULK_URL, json=[])
+    assert response.status_code == 201
+    assert response.json()["count"] == 0
+
+
+def test_add_views_bulk_too_many(authenticated_client: TestClient, test_user):
+    """Test du plafond de visionnages par requête."""
+    response = authenticated_client.post(
+        _BULK_URL,
+        json=[_view(test_user.id)] * (VIEWS_BULK_MAX_SIZE + 1)
+    )
+    assert response.status_code == 422
+    assert response.json()["errors"][0]["type"] == "too_long"